@@ -1,33 +1,10 @@
-import { useState, useEffect } from 'react';
-import axios from 'axios';
+import { useScoreboard } from '../hooks/useScoreboard';
 import './Leaderboard.css';
 
-interface Player {
-    username: string;
-    score: number;
-}
-
 function Leaderboard() {
-    const [players, setPlayers] = useState<Player[]>([]);
-
-    useEffect(() => {
-        // 초기 로드
-        loadLeaderboard();
-
-        // 2초마다 리더보드 업데이트
-        const interval = setInterval(loadLeaderboard, 2000);
-
-        return () => clearInterval(interval);
-    }, []);
-
-    const loadLeaderboard = async () => {
-        try {
-            const response = await axios.get('/api/game/results');
-            setPlayers(response.data);
-        } catch (error) {
-            console.error('Failed to load leaderboard:', error);
-        }
-    };
+    // 서버가 점수 변경 시 보내 주는 순위를 사용 (주기적 요청 없음)
+    const scoreboard = useScoreboard();
+    const players = scoreboard?.players ?? [];
 
     if (players.length === 0) {
         return null; // 플레이어가 없으면 리더보드 표시 안 함
@@ -0,0 +1,87 @@
+import { useEffect, useState } from 'react';
+
+export interface ScoreboardPlayer {
+  username: string;
+  score: number;
+}
+
+// /api/game/winner + /api/game/results 를 합친 구조
+export interface Scoreboard {
+  winner: string;
+  winner_count: number;
+  players: ScoreboardPlayer[]; // 점수 순 정렬
+}
+
+// null: 연결이 끊겨 최신 상태를 알 수 없음 (재연결 후 다시 상태를 받음)
+type Listener = (scoreboard: Scoreboard | null) => void;
+
+const RECONNECT_DELAY_MS = 2000;
+
+// 페이지 안의 모든 구독자가 하나의 WebSocket 연결을 공유
+const listeners = new Set<Listener>();
+let socket: WebSocket | null = null;
+let latest: Scoreboard | null = null;
+let reconnectTimer: number | null = null;
+
+function connect() {
+  const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+  const ws = new WebSocket(`${protocol}//${window.location.host}/ws/game`);
+  socket = ws;
+
+  ws.onmessage = (event) => {
+    latest = JSON.parse(event.data) as Scoreboard;
+    listeners.forEach((listener) => listener(latest!));
+  };
+
+  ws.onclose = () => {
+    if (socket !== ws) return;
+    socket = null;
+    latest = null;
+    // 이전 상태를 계속 쓰지 않도록 구독자에게 연결 끊김을 알림 (GamePage는 폴링으로 전환)
+    listeners.forEach((listener) => listener(null));
+    // 구독자가 남아 있으면 (서버 재시작 등) 잠시 후 재연결
+    if (listeners.size > 0) {
+      reconnectTimer = window.setTimeout(() => {
+        reconnectTimer = null;
+        connect();
+      }, RECONNECT_DELAY_MS);
+    }
+  };
+}
+
+function disconnect() {
+  if (reconnectTimer !== null) {
+    clearTimeout(reconnectTimer);
+    reconnectTimer = null;
+  }
+  const ws = socket;
+  socket = null;
+  latest = null;
+  listeners.forEach((listener) => listener(null));
+  ws?.close();
+}
+
+// 서버가 정답자/순위가 바뀔 때마다 보내는 상태를 구독 (폴링 대체)
+// 연결 직후 서버가 현재 상태를 한 번 보내 줌
+export function useScoreboard(): Scoreboard | null {
+  const [scoreboard, setScoreboard] = useState<Scoreboard | null>(null);
+
+  useEffect(() => {
+    listeners.add(setScoreboard);
+    if (socket === null && reconnectTimer === null) {
+      connect();
+    } else if (latest !== null) {
+      // 이미 열린 연결에 합류하면 마지막 상태부터 사용
+      setScoreboard(latest);
+    }
+
+    return () => {
+      listeners.delete(setScoreboard);
+      if (listeners.size === 0) {
+        disconnect();
+      }
+    };
+  }, []);
+
+  return scoreboard;
+}
@@ -4,6 +4,7 @@ import axios from 'axios';
 import CircularProgress from '../components/CircularProgress';
 import YouTubePlayer, { YouTubePlayerHandle } from '../components/YouTubePlayer';
 import Leaderboard from '../components/Leaderboard';
+import { useScoreboard } from '../hooks/useScoreboard';
 import './GamePage.css';
 
 interface Song {
@@ -15,6 +16,15 @@ interface Song {
   start_time: number; // 재생 시작 지점 (초)
 }
 
+// /api/game/winner 응답 (Scoreboard의 일부)
+interface WinnerStatus {
+  winner: string;
+  winner_count: number;
+}
+
+// WebSocket 연결이 끊겼을 때만 사용하는 정답자 폴링 주기
+const WINNER_FALLBACK_POLL_MS = 3000;
+
 function GamePage() {
   const navigate = useNavigate();
   const location = useLocation();
@@ -32,6 +42,9 @@ function GamePage() {
   const artistTimerRef = useRef<number | null>(null);
   const firstWinnerDetectedTimeRef = useRef<number | null>(null);
   const youtubePlayerRef = useRef<YouTubePlayerHandle>(null);
+  const scoreboard = useScoreboard();
+  const [polledWinner, setPolledWinner] = useState<WinnerStatus | null>(null);
+  const winnerStatus: WinnerStatus | null = scoreboard ?? polledWinner;
 
   useEffect(() => {
     // location이 변경될 때마다 (페이지 진입 시마다) 노래 로드 및 초기화
@@ -221,52 +234,72 @@ function GamePage() {
     navigate('/answer', { state: { skipped: true } });
   };
 
-  // 정답자 체크 - 주기적으로 정답자가 있는지 확인
+  // WebSocket이 끊겨 있는 동안에는 /api/game/winner를 느리게 폴링 (재연결되면 중단)
   useEffect(() => {
-    if (!isPlaying) return;
+    if (!isPlaying || scoreboard) {
+      setPolledWinner(null);
+      return;
+    }
 
-    const checkWinner = async () => {
+    let cancelled = false;
+    const pollWinner = async () => {
       try {
         const response = await axios.get('/api/game/winner');
-        const winnerCount = response.data.winner_count;
+        if (!cancelled) setPolledWinner(response.data);
+      } catch (error) {
+        console.error('Failed to check winner:', error);
+      }
+    };
 
-        // 정답자가 3명 이상이면 즉시 이동
-        if (winnerCount >= 3) {
-          console.log('3 Winners detected:', response.data.winner);
-          stopPlaying();
-          navigate('/answer');
-          return;
-        }
+    const winnerPollInterval = setInterval(pollWinner, WINNER_FALLBACK_POLL_MS);
 
-        // 정답자가 1명 이상이면 타이머 체크
-        if (winnerCount >= 1) {
-          if (firstWinnerDetectedTimeRef.current === null) {
-            firstWinnerDetectedTimeRef.current = Date.now();
-            console.log('First winner detected, starting 3s timer');
-          } else {
-            const elapsed = Date.now() - firstWinnerDetectedTimeRef.current;
-            if (elapsed >= 3000) {
-              console.log('3 seconds passed since first winner');
-              stopPlaying();
-              navigate('/answer');
-            }
-          }
+    return () => {
+      cancelled = true;
+      clearInterval(winnerPollInterval);
+    };
+  }, [isPlaying, scoreboard]);
+
+  // 정답자 체크 - 서버가 보내 준 정답자 수로 확인 (변경 즉시 + 1초마다 3초 경과 확인)
+  useEffect(() => {
+    if (!isPlaying || !winnerStatus) return;
+
+    const checkWinner = () => {
+      const winnerCount = winnerStatus.winner_count;
+
+      // 정답자가 3명 이상이면 즉시 이동
+      if (winnerCount >= 3) {
+        console.log('3 Winners detected:', winnerStatus.winner);
+        stopPlaying();
+        navigate('/answer');
+        return;
+      }
+
+      // 정답자가 1명 이상이면 타이머 체크
+      if (winnerCount >= 1) {
+        if (firstWinnerDetectedTimeRef.current === null) {
+          firstWinnerDetectedTimeRef.current = Date.now();
+          console.log('First winner detected, starting 3s timer');
         } else {
-          // 정답자가 없으면 타이머 리셋
-          firstWinnerDetectedTimeRef.current = null;
+          const elapsed = Date.now() - firstWinnerDetectedTimeRef.current;
+          if (elapsed >= 3000) {
+            console.log('3 seconds passed since first winner');
+            stopPlaying();
+            navigate('/answer');
+          }
         }
-      } catch (error) {
-        console.error('Failed to check winner:', error);
+      } else {
+        // 정답자가 없으면 타이머 리셋
+        firstWinnerDetectedTimeRef.current = null;
       }
     };
 
-    // 1초마다 정답자 확인
+    checkWinner();
     const winnerCheckInterval = setInterval(checkWinner, 1000);
 
     return () => {
       clearInterval(winnerCheckInterval);
     };
-  }, [isPlaying, navigate]);
+  }, [isPlaying, winnerStatus, navigate]);
 
   if (!song) {
     return (
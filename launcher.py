@@ -5,39 +5,111 @@
 - CSV 파일 선택, 참가자 목록/점수 표시
 """
 
-import glob
+import asyncio
+import collections
+import functools
 import logging
 import os
 import shutil
+import socket
 import sys
 import threading
 import time
 import tkinter as tk
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, messagebox, scrolledtext, ttk
 
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 
 
 # 로깅 설정
 class TextHandler(logging.Handler):
-    """tkinter Text 위젯에 로그를 출력하는 핸들러"""
+    """tkinter Text 위젯에 로그를 출력하는 핸들러 (100ms마다 모아서 출력)"""
+
+    FLUSH_INTERVAL_MS = 100
+    MAX_LINES = 1000  # 위젯에 유지할 최대 줄 수
 
     def __init__(self, text_widget):
         super().__init__()
         self.text_widget = text_widget
+        self._buf = collections.deque(maxlen=2000)
+        self._lock = threading.Lock()
+        self._flush_scheduled = False
 
     def emit(self, record):
         msg = self.format(record)
 
-        def append():
-            self.text_widget.configure(state="normal")
-            self.text_widget.insert(tk.END, msg + "\n")
-            self.text_widget.see(tk.END)
-            self.text_widget.configure(state="disabled")
+        with self._lock:
+            self._buf.append(msg)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
 
         # GUI 스레드에서 실행
-        self.text_widget.after(0, append)
+        self.text_widget.after(self.FLUSH_INTERVAL_MS, self._flush)
+
+    def _flush(self):
+        with self._lock:
+            lines = list(self._buf)
+            self._buf.clear()
+            self._flush_scheduled = False
+
+        if not lines:
+            return
+
+        self.text_widget.configure(state="normal")
+        self.text_widget.insert(tk.END, "\n".join(lines) + "\n")
+
+        # 오래된 줄 정리
+        line_count = int(self.text_widget.index("end-1c").split(".")[0])
+        if line_count > self.MAX_LINES:
+            self.text_widget.delete("1.0", f"{line_count - self.MAX_LINES + 1}.0")
+
+        self.text_widget.see(tk.END)
+        self.text_widget.configure(state="disabled")
+
+
+# 상위 3위 행 스타일 태그 (금/은/동)
+RANK_TAGS = (("gold",), ("silver",), ("bronze",))
+
+
+# uvicorn 로깅 설정 비활성화 (충돌 방지)
+_UVICORN_LOG_CONFIG = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "default": {
+            "format": "%(levelprefix)s %(message)s",
+            "use_colors": False,
+        },
+        "access": {
+            "format": "%(levelprefix)s %(client_addr)s - %(request_line)s %(status_code)s",
+            "use_colors": False,
+        },
+    },
+    "handlers": {
+        "default": {
+            "formatter": "default",
+            "class": "logging.NullHandler",
+        },
+        "access": {
+            "formatter": "access",
+            "class": "logging.NullHandler",
+        },
+    },
+    "loggers": {
+        "uvicorn": {"handlers": ["default"], "level": "INFO"},
+        "uvicorn.error": {"level": "INFO"},
+        "uvicorn.access": {
+            "handlers": ["access"],
+            "level": "INFO",
+            "propagate": False,
+        },
+    },
+}
 
 
 # 전역 로거
@@ -46,33 +118,44 @@ logger.setLevel(logging.DEBUG)
 
 
 # PyInstaller 호환 경로 처리
-def resource_path(relative_path):
-    """PyInstaller 번들 또는 개발 환경에서 리소스 경로 반환"""
+@functools.lru_cache(maxsize=1)
+def _resource_base():
+    """번들 리소스 기준 경로 (최초 1회만 계산)"""
     try:
         # PyInstaller가 생성한 임시 폴더
-        base_path = sys._MEIPASS
+        return sys._MEIPASS
     except AttributeError:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+        return os.path.abspath(".")
 
 
-def get_data_path(relative_path):
-    """실행 파일과 같은 폴더에 있는 데이터 파일 경로 (CSV, .env 등)"""
+@functools.lru_cache(maxsize=1)
+def _data_base():
+    """데이터 파일 기준 경로 (최초 1회만 계산)"""
     if getattr(sys, "frozen", False):
         # PyInstaller로 빌드된 exe 실행 시
-        base_path = os.path.dirname(sys.executable)
-    else:
-        # 개발 환경
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+        return os.path.dirname(sys.executable)
+    # 개발 환경
+    return os.path.abspath(".")
+
+
+def resource_path(relative_path):
+    """PyInstaller 번들 또는 개발 환경에서 리소스 경로 반환"""
+    return os.path.join(_resource_base(), relative_path)
+
+
+def get_data_path(relative_path):
+    """실행 파일과 같은 폴더에 있는 데이터 파일 경로 (CSV, .env 등)"""
+    return os.path.join(_data_base(), relative_path)
 
 
 class ServerManager:
     """FastAPI 서버를 별도 스레드에서 관리"""
 
-    def __init__(self, host="0.0.0.0", port=8000):
+    def __init__(self, host="0.0.0.0", port=8000, http=None):
         self.host = host
         self.port = port
+        # 런처와 공유하는 HTTP 세션 (keep-alive 연결 재사용)
+        self.http = http or requests.Session()
         self.server_thread = None
         self.server = None
         self.is_running = False
@@ -94,40 +177,26 @@ class ServerManager:
 
                 logger.debug("uvicorn 설정 중...")
 
-                # uvicorn 로깅 설정 비활성화 (충돌 방지)
-                log_config = {
-                    "version": 1,
-                    "disable_existing_loggers": False,
-                    "formatters": {
-                        "default": {
-                            "format": "%(levelprefix)s %(message)s",
-                            "use_colors": False,
-                        },
-                        "access": {
-                            "format": "%(levelprefix)s %(client_addr)s - %(request_line)s %(status_code)s",
-                            "use_colors": False,
-                        },
-                    },
-                    "handlers": {
-                        "default": {
-                            "formatter": "default",
-                            "class": "logging.NullHandler",
-                        },
-                        "access": {
-                            "formatter": "access",
-                            "class": "logging.NullHandler",
-                        },
-                    },
-                    "loggers": {
-                        "uvicorn": {"handlers": ["default"], "level": "INFO"},
-                        "uvicorn.error": {"level": "INFO"},
-                        "uvicorn.access": {
-                            "handlers": ["access"],
-                            "level": "INFO",
-                            "propagate": False,
-                        },
-                    },
-                }
+                # POSIX에서는 uvloop 사용 (Windows는 기본 asyncio 루프)
+                if sys.platform == "win32":
+                    loop_kind = "asyncio"
+                else:
+                    try:
+                        import uvloop  # noqa: F401
+
+                        loop_kind = "uvloop"
+                    except ImportError:
+                        loop_kind = "auto"
+                logger.debug(f"이벤트 루프: {loop_kind}")
+
+                # C 구현 HTTP 파서(httptools)가 있으면 사용
+                try:
+                    import httptools  # noqa: F401
+
+                    http_kind = "httptools"
+                except ImportError:
+                    http_kind = "auto"
+                logger.debug(f"HTTP 파서: {http_kind}")
 
                 config = uvicorn.Config(
                     app,
@@ -135,7 +204,9 @@ class ServerManager:
                     port=self.port,
                     log_level="warning",
                     reload=False,
-                    log_config=log_config,
+                    loop=loop_kind,
+                    http=http_kind,
+                    log_config=_UVICORN_LOG_CONFIG,
                 )
                 self.server = uvicorn.Server(config)
                 self.is_running = True
@@ -154,19 +225,35 @@ class ServerManager:
         self.server_thread.start()
 
         # 서버가 시작될 때까지 대기
+        # 포트가 열렸는지 TCP 연결로만 가볍게 확인한 뒤, HTTP 요청은 한 번만 보냄
         logger.debug("서버 응답 대기 중...")
-        for i in range(50):  # 최대 5초 대기
-            time.sleep(0.1)
+        started_at = time.monotonic()
+        deadline = started_at + 5.0  # 최대 5초 대기
+        next_log_at = started_at
+        while time.monotonic() < deadline:
             try:
-                response = requests.get(
+                with socket.create_connection(("127.0.0.1", self.port), timeout=0.05):
+                    pass
+            except OSError:
+                if logger.isEnabledFor(logging.DEBUG):
+                    now = time.monotonic()
+                    if now >= next_log_at:
+                        logger.debug(f"서버 연결 대기... ({now - started_at:.1f}초)")
+                        next_log_at = now + 0.5
+                time.sleep(0.025)
+                continue
+
+            # FastAPI 라우트까지 준비됐는지 확인
+            try:
+                response = self.http.get(
                     f"http://localhost:{self.port}/api/game/state", timeout=1
                 )
                 if response.status_code == 200:
                     logger.info("서버 시작 완료!")
                     return True
-            except Exception:
-                if i % 10 == 0:
-                    logger.debug(f"서버 연결 대기... ({i / 10:.1f}초)")
+            except Exception as e:
+                logger.debug(f"서버 응답 확인 실패: {e}")
+            time.sleep(0.025)
 
         logger.error("서버 시작 타임아웃 (5초)")
         return False
@@ -190,10 +277,32 @@ class GameLauncher(tk.Tk):
         self.geometry("800x750")
         self.resizable(True, True)
 
+        # 로컬 서버 호출용 HTTP 세션 (매 요청마다 새 연결을 만들지 않도록 재사용)
+        self.http = requests.Session()
+        self.http.mount(
+            "http://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0),
+        )
+
         # 서버 매니저
-        self.server_manager = ServerManager()
+        self.server_manager = ServerManager(http=self.http)
         self.api_base = "http://localhost:8000"
 
+        # 참가자 목록 갱신 주기 (ms)
+        self._poll_interval_ms = 5000
+
+        # 참가자 목록 폴링용 asyncio 루프 (전용 스레드) 및 keep-alive 세션
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        self._aio_session = asyncio.run_coroutine_threadsafe(
+            self._create_aio_session(), self._loop
+        ).result()
+
+        # 짧은 HTTP 작업용 공유 스레드 풀 (서버 부팅은 별도 스레드)
+        self._pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="launcher-http"
+        )
+
         # 현재 선택된 CSV 파일
         self.current_csv = tk.StringVar(value="songs.csv")
 
@@ -212,6 +321,17 @@ class GameLauncher(tk.Tk):
         # 창 닫기 이벤트
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+    def _submit(self, fn):
+        """HTTP 작업을 스레드 풀에서 실행"""
+        future = self._pool.submit(fn)
+        future.add_done_callback(self._on_job_done)
+        return future
+
+    @staticmethod
+    def _on_job_done(future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.debug(f"백그라운드 작업 오류: {future.exception()}")
+
     def setup_logging(self):
         """로깅 핸들러 설정"""
         # Text 위젯 핸들러
@@ -319,6 +439,10 @@ class GameLauncher(tk.Tk):
             participants_frame, columns=columns, show="headings", height=15
         )
 
+        # 현재 표시 중인 행 ID (순위 순서) 및 마지막으로 그린 데이터
+        self._tree_items: list[str] = []
+        self._last_ui_key = None
+
         self.participants_tree.heading("rank", text="순위")
         self.participants_tree.heading("username", text="닉네임")
         self.participants_tree.heading("score", text="점수")
@@ -327,6 +451,11 @@ class GameLauncher(tk.Tk):
         self.participants_tree.column("username", width=300, anchor=tk.W)
         self.participants_tree.column("score", width=100, anchor=tk.CENTER)
 
+        # 상위 3위 강조 (위젯 생성 시 한 번만 설정)
+        self.participants_tree.tag_configure("gold", foreground="#d4a017")
+        self.participants_tree.tag_configure("silver", foreground="#8a8d91")
+        self.participants_tree.tag_configure("bronze", foreground="#b0682a")
+
         # 스크롤바
         scrollbar = ttk.Scrollbar(
             participants_frame, orient=tk.VERTICAL, command=self.participants_tree.yview
@@ -377,11 +506,17 @@ class GameLauncher(tk.Tk):
     def refresh_csv_list(self):
         """실행 파일 폴더의 CSV 파일 목록 갱신"""
         data_dir = get_data_path("")
-        csv_files = glob.glob(os.path.join(data_dir, "*.csv"))
-        csv_names = [os.path.basename(f) for f in csv_files]
-
-        logger.debug(f"CSV 파일 검색: {data_dir}")
-        logger.debug(f"발견된 CSV 파일: {csv_names}")
+        with os.scandir(data_dir) as entries:
+            csv_names = [
+                e.name
+                for e in entries
+                if e.name.lower().endswith(".csv")
+                and not e.name.startswith(".")
+                and e.is_file()
+            ]
+
+        logger.debug("CSV 파일 검색: %s", data_dir)
+        logger.debug("발견된 CSV 파일: %s", csv_names)
 
         if not csv_names:
             csv_names = ["songs.csv (파일 없음)"]
@@ -406,8 +541,13 @@ class GameLauncher(tk.Tk):
             filename = os.path.basename(filepath)
             dest_path = get_data_path(filename)
 
-            # 원본과 대상이 다를 경우에만 복사
-            if os.path.abspath(filepath) != os.path.abspath(dest_path):
+            # 원본과 대상이 다를 경우에만 복사 (대상이 아직 없으면 다른 파일)
+            try:
+                same_file = os.path.samefile(filepath, dest_path)
+            except FileNotFoundError:
+                same_file = False
+
+            if not same_file:
                 try:
                     shutil.copy2(filepath, dest_path)
                     logger.info(f"파일 복사됨: {filepath} -> {dest_path}")
@@ -443,16 +583,16 @@ class GameLauncher(tk.Tk):
 
         def send_request():
             try:
-                response = requests.post(
+                response = self.http.post(
                     f"{self.api_base}/api/game/load-csv",
                     json={"filename": csv_file},
                     timeout=5,
                 )
                 self.after(0, lambda: self._handle_load_response(response))
-            except Exception:
-                self.after(0, lambda: self._handle_load_error(e))
+            except Exception as e:
+                self.after(0, lambda err=e: self._handle_load_error(err))
 
-        threading.Thread(target=send_request, daemon=True).start()
+        self._submit(send_request)
 
     def _handle_load_response(self, response):
         if response.status_code == 200:
@@ -477,7 +617,35 @@ class GameLauncher(tk.Tk):
         logger.info("서버 시작 버튼 클릭")
         self.server_status_label.config(text="⏳ 서버 시작 중...", foreground="orange")
         self.start_server_btn.config(state=tk.DISABLED)
-        self.update()
+        self.update_idletasks()
+
+        def _check_server():
+            # 프론트엔드 상태 확인 (본문 앞부분만 읽음)
+            try:
+                with self.http.get(
+                    f"{self.api_base}/", timeout=3, stream=True
+                ) as response:
+                    head = response.raw.read(128, decode_content=True).decode(
+                        "utf-8", "ignore"
+                    )
+                if response.status_code == 200 and "<!DOCTYPE html>" in head:
+                    logger.info("프론트엔드 서빙 확인됨")
+                else:
+                    logger.warning("프론트엔드가 로드되지 않았습니다")
+            except Exception as e:
+                logger.warning(f"프론트엔드 확인 실패: {e}")
+
+            # 기본 CSV 로드 상태 확인
+            try:
+                response = self.http.get(f"{self.api_base}/api/songs", timeout=3)
+                if response.status_code == 200:
+                    songs = response.json()
+                    self.csv_status_label.config(
+                        text=f"✅ {len(songs)}곡 로드됨", foreground="green"
+                    )
+                    logger.info(f"기본 CSV 로드됨: {len(songs)}곡")
+            except Exception as e:
+                logger.debug(f"기본 CSV 상태 확인 실패: {e}")
 
         def _start():
             success = self.server_manager.start()
@@ -490,30 +658,8 @@ class GameLauncher(tk.Tk):
                 self.stop_server_btn.config(state=tk.NORMAL)
                 self.start_server_btn.config(state=tk.DISABLED)
 
-                # 프론트엔드 상태 확인
-                try:
-                    response = requests.get(f"{self.api_base}/", timeout=3)
-                    if (
-                        response.status_code == 200
-                        and "<!DOCTYPE html>" in response.text[:100]
-                    ):
-                        logger.info("프론트엔드 서빙 확인됨")
-                    else:
-                        logger.warning("프론트엔드가 로드되지 않았습니다")
-                except Exception as e:
-                    logger.warning(f"프론트엔드 확인 실패: {e}")
-
-                # 기본 CSV 로드 상태 확인
-                try:
-                    response = requests.get(f"{self.api_base}/api/songs", timeout=3)
-                    if response.status_code == 200:
-                        songs = response.json()
-                        self.csv_status_label.config(
-                            text=f"✅ {len(songs)}곡 로드됨", foreground="green"
-                        )
-                        logger.info(f"기본 CSV 로드됨: {len(songs)}곡")
-                except Exception as e:
-                    logger.debug(f"기본 CSV 상태 확인 실패: {e}")
+                # 후속 확인은 스레드 풀에서 실행
+                self._submit(_check_server)
             else:
                 self.server_status_label.config(
                     text="❌ 서버 시작 실패", foreground="red"
@@ -525,6 +671,7 @@ class GameLauncher(tk.Tk):
                     "서버를 시작할 수 없습니다. 포트 8000이 이미 사용 중일 수 있습니다.",
                 )
 
+        # 서버 부팅은 수 초간 블로킹되므로 별도 스레드에서 실행
         threading.Thread(target=_start, daemon=True).start()
 
     def stop_server(self):
@@ -549,60 +696,76 @@ class GameLauncher(tk.Tk):
         self.log_text.configure(state="disabled")
         logger.debug("로그 지움")
 
+    async def _create_aio_session(self):
+        """폴링 루프 안에서 aiohttp 세션 생성"""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=1),
+        )
+
     def update_participants_periodically(self):
-        """2초마다 참가자 목록 갱신 (백그라운드 스레드에서 실행)"""
-        if not self.server_manager.is_running:
-            self.after(2000, self.update_participants_periodically)
+        """참가자 목록 주기적 갱신 (게임 중 1초, 대기 중 5초 간격)"""
+        # 서버가 꺼져 있거나 창이 최소화된 상태면 요청 없이 다음 주기만 예약
+        if not self.server_manager.is_running or self.state() == "iconic":
+            self.after(self._poll_interval_ms, self.update_participants_periodically)
             return
 
-        def _fetch_and_update():
-            try:
-                # 참가자 목록
-                response = requests.get(f"{self.api_base}/api/game/results", timeout=1)
-                players = response.json() if response.status_code == 200 else []
+        asyncio.run_coroutine_threadsafe(self._poll(), self._loop)
+        self.after(self._poll_interval_ms, self.update_participants_periodically)
 
-                # 게임 상태
-                state_response = requests.get(
-                    f"{self.api_base}/api/game/state", timeout=1
-                )
-                state = (
-                    state_response.json() if state_response.status_code == 200 else {}
-                )
+    async def _fetch_json(self, path, default):
+        async with self._aio_session.get(f"{self.api_base}{path}") as response:
+            return await response.json() if response.status == 200 else default
 
-                # UI 업데이트는 메인 스레드에서 실행
-                self.after(0, lambda: self._update_participants_ui(players, state))
-            except Exception:
-                pass  # 연결 실패 시 무시
+    async def _poll(self):
+        """참가자 목록과 게임 상태를 동시에 요청 (폴링 루프에서 실행)"""
+        try:
+            players, state = await asyncio.gather(
+                self._fetch_json("/api/game/results", []),
+                self._fetch_json("/api/game/state", {}),
+            )
 
-        threading.Thread(target=_fetch_and_update, daemon=True).start()
-        self.after(2000, self.update_participants_periodically)
+            # UI 업데이트는 메인 스레드에서 실행
+            self.after(0, lambda: self._update_participants_ui(players, state))
+        except Exception:
+            pass  # 연결 실패 시 무시
 
     def _update_participants_ui(self, players, state):
         """UI 업데이트 (메인 스레드에서 실행)"""
         try:
-            # 기존 항목 삭제
-            for item in self.participants_tree.get_children():
-                self.participants_tree.delete(item)
-
-            # 새 항목 추가
-            for idx, player in enumerate(players, 1):
-                rank_text = (
-                    f"🥇 {idx}"
-                    if idx == 1
-                    else (
-                        f"🥈 {idx}"
-                        if idx == 2
-                        else (f"🥉 {idx}" if idx == 3 else str(idx))
+            # 참가자/점수와 게임 상태가 그대로면 다시 그리지 않음
+            players_key = tuple((p["username"], p["score"]) for p in players)
+            state_key = tuple(state.items())
+            if (players_key, state_key) == self._last_ui_key:
+                return
+            self._last_ui_key = (players_key, state_key)
+
+            # 기존 행은 값만 바꾸고, 인원 수가 달라질 때만 행 추가/삭제
+            for idx, player in enumerate(players):
+                values = (idx + 1, player["username"], f"{player['score']}점")
+                tags = RANK_TAGS[idx] if idx < 3 else ()
+                if idx < len(self._tree_items):
+                    self.participants_tree.item(
+                        self._tree_items[idx], values=values, tags=tags
                     )
-                )
-                self.participants_tree.insert(
-                    "",
-                    tk.END,
-                    values=(rank_text, player["username"], f"{player['score']}점"),
-                )
+                else:
+                    self._tree_items.append(
+                        self.participants_tree.insert(
+                            "", tk.END, values=values, tags=tags
+                        )
+                    )
+
+            # 남는 행 삭제 (한 번의 호출로)
+            stale_items = self._tree_items[len(players) :]
+            if stale_items:
+                self.participants_tree.delete(*stale_items)
+                del self._tree_items[len(players) :]
 
             self.participant_count_label.config(text=f"총 참가자: {len(players)}명")
 
+            # 게임 중에는 자주, 대기 중에는 드물게 갱신
+            self._poll_interval_ms = 1000 if state.get("is_playing") else 5000
+
             # 게임 상태 업데이트
             if state.get("is_playing"):
                 progress = state.get("current_progress", 0)
@@ -626,7 +789,7 @@ class GameLauncher(tk.Tk):
 
             def _reset():
                 try:
-                    response = requests.post(
+                    response = self.http.post(
                         f"{self.api_base}/api/game/reset-scores", timeout=5
                     )
                     if response.status_code == 200:
@@ -658,7 +821,18 @@ class GameLauncher(tk.Tk):
                         ),
                     )
 
-            threading.Thread(target=_reset, daemon=True).start()
+            self._submit(_reset)
+
+    def _close_http(self):
+        """HTTP 세션, 스레드 풀 및 폴링 루프 정리"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        closing = asyncio.run_coroutine_threadsafe(
+            self._aio_session.close(), self._loop
+        )
+        closing.add_done_callback(
+            lambda _: self._loop.call_soon_threadsafe(self._loop.stop)
+        )
+        self.http.close()
 
     def on_closing(self):
         """앱 종료 시 서버도 종료"""
@@ -668,9 +842,11 @@ class GameLauncher(tk.Tk):
             ):
                 logger.info("프로그램 종료 (서버 실행 중)")
                 self.server_manager.stop()
+                self._close_http()
                 self.destroy()
         else:
             logger.info("프로그램 종료")
+            self._close_http()
             self.destroy()
 
 
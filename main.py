@@ -1,21 +1,53 @@
 import asyncio
+import bisect
+import collections
 import csv
+import functools
 import json
+import logging
+import logging.handlers
+import operator
 import os
+import queue
 import random
+import re
 import sys
+import time
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from typing import List
 
 import aiohttp
 import socketio
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import (
+    JSONResponse,
+    ORJSONResponse,
+    RedirectResponse,
+    Response,
+)
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+# orjson이 있으면 JSON 파싱/응답 직렬화에 사용 (없으면 표준 json)
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+    DefaultResponse = ORJSONResponse
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    DefaultResponse = JSONResponse
 
 # 빌드 시 주입된 시크릿 모듈 가져오기 (존재할 경우)
 try:
@@ -25,25 +57,34 @@ except ImportError:
 
 
 # PyInstaller 호환 경로 처리
-def resource_path(relative_path):
-    """PyInstaller 번들 또는 개발 환경에서 리소스 경로 반환 (번들 내부 파일용)"""
+@functools.lru_cache(maxsize=1)
+def _resource_base():
+    """번들 리소스 기준 경로 (최초 1회만 계산)"""
     try:
         # PyInstaller가 생성한 임시 폴더
-        base_path = sys._MEIPASS
+        return sys._MEIPASS
     except AttributeError:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+        return os.path.abspath(".")
 
 
-def get_data_path(relative_path):
-    """실행 파일과 같은 폴더에 있는 데이터 파일 경로 (CSV, .env 등 사용자 파일용)"""
+@functools.lru_cache(maxsize=1)
+def _data_base():
+    """데이터 파일 기준 경로 (최초 1회만 계산)"""
     if getattr(sys, "frozen", False):
         # PyInstaller로 빌드된 exe 실행 시
-        base_path = os.path.dirname(sys.executable)
-    else:
-        # 개발 환경
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+        return os.path.dirname(sys.executable)
+    # 개발 환경
+    return os.path.abspath(".")
+
+
+def resource_path(relative_path):
+    """PyInstaller 번들 또는 개발 환경에서 리소스 경로 반환 (번들 내부 파일용)"""
+    return os.path.join(_resource_base(), relative_path)
+
+
+def get_data_path(relative_path):
+    """실행 파일과 같은 폴더에 있는 데이터 파일 경로 (CSV, .env 등 사용자 파일용)"""
+    return os.path.join(_data_base(), relative_path)
 
 
 # 환경 변수 로드 (실행 파일 폴더의 .env)
@@ -53,12 +94,64 @@ load_dotenv(get_data_path(".env"))
 if built_secrets:
     built_secrets.load_secrets()
 
+
+@dataclass(frozen=True, slots=True)
+class ChzzkConfig:
+    """치지직 Open API 인증 설정 (환경 변수에서 시작 시 한 번만 읽음)"""
+
+    client_id: str
+    client_secret: str
+
+
+CHZZK_CFG = ChzzkConfig(
+    client_id=os.getenv("CHZZK_CLIENT_ID", ""),
+    client_secret=os.getenv("CHZZK_CLIENT_SECRET", ""),
+)
+
+# DEBUG=1 일 때만 Socket.IO/Engine.IO 상세 로그 출력 (채팅마다 로그 포맷팅 비용 발생)
+DEBUG = os.getenv("DEBUG", "").lower() in ("1", "true", "yes")
+
+# 채팅 처리/게임 진행처럼 자주 호출되는 경로의 로그
+# 큐에만 넣고 실제 출력은 백그라운드 스레드에서 (이벤트 루프가 stdout 쓰기에 막히지 않도록)
+logger = logging.getLogger("nomat.server")
+logger.setLevel(logging.DEBUG if DEBUG else logging.INFO)
+logger.propagate = False
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_stream_handler = logging.StreamHandler(sys.stdout)
+_log_stream_handler.setFormatter(
+    logging.Formatter("[%(asctime)s] %(levelname)s: %(message)s", datefmt="%H:%M:%S")
+)
+# lifespan에서 시작/종료
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+
 # Socket.IO 클라이언트 (Open API)
-sio = socketio.AsyncClient(reconnection=False, logger=True, engineio_logger=True)
+sio = socketio.AsyncClient(reconnection=False, logger=DEBUG, engineio_logger=DEBUG)
 current_access_token = None
 current_session_key = None
 is_shutting_down = False
 
+# 연속 재연결 시도 횟수 (채팅 구독까지 성공하면 0으로 초기화, 대기 시간은 지수적으로 증가)
+reconnect_attempt = 0
+RECONNECT_MAX_DELAY = 30
+# 실행 중인 재연결 태스크 (동시에 하나만 실행)
+_reconnect_task: asyncio.Task | None = None
+
+# 수신한 채팅 (닉네임, 내용) 큐 (lifespan에서 생성)
+chat_queue: asyncio.Queue[tuple[str, str]] | None = None
+CHAT_BATCH_SIZE = 64
+
+# 최근 받은 (닉네임, 내용) -> 수신 시각 (같은 사람이 같은 채팅을 반복하면 무시)
+recent_chats: collections.OrderedDict[tuple[str, str], float] = (
+    collections.OrderedDict()
+)
+RECENT_CHAT_MAX = 1024
+RECENT_CHAT_WINDOW = 5.0
+
+# 큐가 가득 차서 버린 채팅 수 (로그는 최대 1초에 한 번만 출력)
+_dropped_chats = 0
+_last_drop_log = 0.0
+
 
 @sio.event
 async def connect():
@@ -67,23 +160,39 @@ async def connect():
 
 @sio.event
 async def disconnect():
+    global _reconnect_task
     print("Socket disconnected")
-    if not is_shutting_down and current_access_token:
-        print("Connection lost. Attempting to reconnect in 1 second...")
-        await asyncio.sleep(1)
+    if is_shutting_down or not current_access_token:
+        return
+    if _reconnect_task is None or _reconnect_task.done():
+        _reconnect_task = asyncio.create_task(reconnect_chzzk_socket())
+
+
+async def reconnect_chzzk_socket():
+    """연결이 끊긴 뒤 성공할 때까지 재연결 시도 (지수 백오프 + 지터로 재연결 폭주 방지)"""
+    global reconnect_attempt
+    while True:
+        delay = min(RECONNECT_MAX_DELAY, 2**reconnect_attempt) + random.uniform(0, 1)
+        reconnect_attempt += 1
+        print(f"Connection lost. Attempting to reconnect in {delay:.1f} seconds...")
+        await asyncio.sleep(delay)
+        # 대기 중에 종료되었거나 다른 경로로 이미 다시 연결되었으면 중단
+        if is_shutting_down or not current_access_token or sio.connected:
+            return
         # 재연결 시도 (새로운 소켓 URL 요청 포함)
-        asyncio.create_task(connect_to_chzzk_socket(current_access_token))
+        if await connect_to_chzzk_socket(current_access_token):
+            return
 
 
 @sio.on("SYSTEM")
 async def on_system(data):
-    global current_session_key
+    global current_session_key, reconnect_attempt
     print(f"SYSTEM event received: {data}")
 
     # data가 문자열이면 JSON 파싱
     if isinstance(data, str):
         try:
-            data = json.loads(data)
+            data = json_loads(data)
         except json.JSONDecodeError:
             print("Failed to parse SYSTEM event data as JSON")
             return
@@ -98,7 +207,9 @@ async def on_system(data):
         current_session_key = session_key
         print(f"Session Key obtained: {session_key}")
         if current_access_token:
-            await subscribe_chat(session_key, current_access_token)
+            if await subscribe_chat(session_key, current_access_token):
+                # 채팅 구독까지 끝나야 연결이 완료된 것으로 보고 백오프 초기화
+                reconnect_attempt = 0
 
 
 def handle_game_answer(username: str, answer: str):
@@ -112,7 +223,8 @@ def handle_game_answer(username: str, answer: str):
         return
 
     # 현재 노래가 없으면 무시
-    if game_state.current_song_index >= len(songs_data):
+    songs = song_catalog.table
+    if game_state.current_song_index >= len(songs):
         return
 
     answer = answer.strip()
@@ -121,22 +233,16 @@ def handle_game_answer(username: str, answer: str):
     if not answer:
         return
 
-    current_song = songs_data[game_state.current_song_index]
-
     # 이미 3명의 정답자가 나왔으면 무시
     if len(game_state.current_winners) >= 3:
         return
 
     # 이미 정답을 맞춘 사람은 무시
-    if username in game_state.current_winners:
+    if username in current_winners_set:
         return
 
     # 여러 정답 중 하나라도 일치하면 정답으로 인정 (띄어쓰기 무시)
-    answer_normalized = answer.lower().replace(" ", "")
-    is_correct = any(
-        answer_normalized == title.strip().lower().replace(" ", "")
-        for title in current_song.title
-    )
+    is_correct = songs.is_answer(game_state.current_song_index, answer)
 
     if is_correct:
         # 순위에 따른 점수 계산
@@ -150,20 +256,17 @@ def handle_game_answer(username: str, answer: str):
             points = 1
 
         # 플레이어 점수 업데이트
-        player_found = False
-        for player in game_state.players:
-            if player.username == username:
-                player.score += points
-                player_found = True
-                break
-
-        if not player_found:
-            game_state.players.append(Player(username=username, score=points))
+        add_player_score(username, points)
 
         # 현재 노래의 정답자 저장
         game_state.current_winners.append(username)
-        print(
-            f"✅ {username} 님이 정답을 맞혔습니다 ({rank + 1}등, {points}점): {answer}"
+        current_winners_set.add(username)
+        logger.info(
+            "✅ %s 님이 정답을 맞혔습니다 (%d등, %d점): %s",
+            username,
+            rank + 1,
+            points,
+            answer,
         )
 
 
@@ -172,12 +275,20 @@ async def on_chat(data):
     """채팅 메시지 수신 (Open API)"""
     # print(f"OpenAPI Chat received: {data}")
 
+    # 정답을 받을 수 없는 상태면 파싱 전에 바로 무시
+    if (
+        not game_state.is_playing
+        or game_state.showing_answer
+        or len(game_state.current_winners) >= 3
+    ):
+        return
+
     # data가 문자열이면 JSON 파싱
     if isinstance(data, str):
         try:
-            data = json.loads(data)
+            data = json_loads(data)
         except json.JSONDecodeError:
-            print("Failed to parse CHAT event data as JSON")
+            logger.warning("Failed to parse CHAT event data as JSON")
             return
 
     # 데이터 구조 파싱
@@ -189,11 +300,66 @@ async def on_chat(data):
 
     if content and nickname:
         # print(f"Chat: [{nickname}] {content}")
-        handle_game_answer(nickname, content)
+        key = (nickname, content)
+        now = time.monotonic()
+        if _is_duplicate_chat(key, now):
+            return
+        # 정답 처리는 백그라운드 소비자가 묶어서 처리
+        try:
+            chat_queue.put_nowait(key)
+        except asyncio.QueueFull:
+            _log_dropped_chat()
+            return
+        # 큐에 들어간 채팅만 기록 (버려진 채팅은 다시 보내면 처리되도록)
+        _remember_chat(key, now)
+
 
+def _is_duplicate_chat(key: tuple[str, str], now: float) -> bool:
+    """최근 RECENT_CHAT_WINDOW초 안에 같은 사람이 보낸 같은 채팅인지 확인"""
+    seen = recent_chats.get(key)
+    return seen is not None and now - seen < RECENT_CHAT_WINDOW
 
-async def subscribe_chat(session_key: str, access_token: str):
-    """채팅 이벤트 구독"""
+
+def _remember_chat(key: tuple[str, str], now: float):
+    """처리 대기열에 넣은 채팅 기록 (최근 RECENT_CHAT_MAX개만 유지)"""
+    recent_chats[key] = now
+    recent_chats.move_to_end(key)
+    if len(recent_chats) > RECENT_CHAT_MAX:
+        recent_chats.popitem(last=False)
+
+
+def _log_dropped_chat():
+    """버린 채팅 수를 세고 1초에 한 번만 로그 출력"""
+    global _dropped_chats, _last_drop_log
+    _dropped_chats += 1
+    now = time.monotonic()
+    if now - _last_drop_log >= 1.0:
+        logger.warning("Chat queue full, dropped %d message(s)", _dropped_chats)
+        _dropped_chats = 0
+        _last_drop_log = now
+
+
+async def process_chat_queue():
+    """채팅 큐를 비우며 최대 CHAT_BATCH_SIZE개씩 묶어서 정답 처리"""
+    while True:
+        batch = [await chat_queue.get()]
+        while len(batch) < CHAT_BATCH_SIZE and not chat_queue.empty():
+            batch.append(chat_queue.get_nowait())
+
+        winner_count = len(game_state.current_winners)
+        for nickname, content in batch:
+            try:
+                handle_game_answer(nickname, content)
+            except Exception as e:
+                logger.error("Error handling chat answer: %s", e)
+
+        # 묶음 처리 중 정답자가 생겼으면 한 번만 알림
+        if len(game_state.current_winners) != winner_count:
+            broadcast_scoreboard()
+
+
+async def subscribe_chat(session_key: str, access_token: str) -> bool:
+    """채팅 이벤트 구독 (성공 여부 반환)"""
     url = "https://openapi.chzzk.naver.com/open/v1/sessions/events/subscribe/chat"
     headers = {
         "Authorization": f"Bearer {access_token}",
@@ -201,16 +367,18 @@ async def subscribe_chat(session_key: str, access_token: str):
     }
     params = {"sessionKey": session_key}
 
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.post(url, headers=headers, params=params) as response:
-                if response.status == 200:
-                    print(f"Subscribed to chat events for session {session_key}")
-                else:
-                    text = await response.text()
-                    print(f"Failed to subscribe to chat: {response.status} - {text}")
-        except Exception as e:
-            print(f"Error subscribing to chat: {e}")
+    try:
+        async with app.state.http.post(url, headers=headers, params=params) as response:
+            if response.status == 200:
+                # 본문은 필요 없으므로 읽지 않고 연결을 바로 풀에 반환
+                response.release()
+                print(f"Subscribed to chat events for session {session_key}")
+                return True
+            text = await response.text()
+            print(f"Failed to subscribe to chat: {response.status} - {text}")
+    except Exception as e:
+        print(f"Error subscribing to chat: {e}")
+    return False
 
 
 async def unsubscribe_chat(session_key: str, access_token: str):
@@ -222,30 +390,50 @@ async def unsubscribe_chat(session_key: str, access_token: str):
     }
     params = {"sessionKey": session_key}
 
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.post(url, headers=headers, params=params) as response:
-                if response.status == 200:
-                    print(f"Unsubscribed from chat events for session {session_key}")
-                else:
-                    text = await response.text()
-                    print(
-                        f"Failed to unsubscribe from chat: {response.status} - {text}"
-                    )
-        except Exception as e:
-            print(f"Error unsubscribing from chat: {e}")
+    try:
+        async with app.state.http.post(url, headers=headers, params=params) as response:
+            if response.status == 200:
+                response.release()
+                print(f"Unsubscribed from chat events for session {session_key}")
+            else:
+                text = await response.text()
+                print(f"Failed to unsubscribe from chat: {response.status} - {text}")
+    except Exception as e:
+        print(f"Error unsubscribing from chat: {e}")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """FastAPI 서버의 생명주기 관리"""
-    # 서버 시작 시
-    load_songs()
+    global chat_queue, is_shutting_down
+
+    _log_listener.start()
+
+    # 서버 시작 시: 노래 로드는 스레드에서 진행하고 그동안 나머지 초기화
+    load_task = asyncio.create_task(asyncio.to_thread(load_songs))
+
+    # 채팅 정답 처리 큐 및 소비자 태스크
+    chat_queue = asyncio.Queue(maxsize=10000)
+    chat_consumer = asyncio.create_task(process_chat_queue())
+
+    # 치지직 API 호출용 공유 HTTP 세션 (keep-alive 연결 재사용)
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=100, limit_per_host=20, keepalive_timeout=30, ttl_dns_cache=300
+        )
+    )
+
+    # 요청을 받기 전에 노래 목록이 준비되도록 대기
+    await load_task
 
     yield
 
-    # 서버 종료 시
+    # 서버 종료 시 (이후 연결 끊김 이벤트에서 재연결하지 않음)
+    is_shutting_down = True
     print("Shutting down...")
+    chat_consumer.cancel()
+    if _reconnect_task is not None:
+        _reconnect_task.cancel()
 
     # Open API 소켓 정리
     if current_session_key and current_access_token:
@@ -256,8 +444,13 @@ async def lifespan(app: FastAPI):
         print("Disconnecting Socket.IO...")
         await sio.disconnect()
 
+    await app.state.http.close()
+    _log_listener.stop()
 
-app = FastAPI(title="노래 맞추기 게임", lifespan=lifespan)
+
+app = FastAPI(
+    title="노래 맞추기 게임", lifespan=lifespan, default_response_class=DefaultResponse
+)
 
 # CORS 설정
 app.add_middleware(
@@ -268,9 +461,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 큰 JSON 응답(노래 목록, 참가자 목록 등) 압축
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # 데이터 모델
 class Song(BaseModel):
+    # 로드 후 변경되지 않으므로 필드 재할당 금지
+    model_config = ConfigDict(frozen=True)
+
     id: int
     title: List[str]  # 여러 정답 허용 (예: ["다이너마이트", "Dynamite"])
     youtube_url: str
@@ -280,7 +479,9 @@ class Song(BaseModel):
     start_time: int = 0  # 재생 시작 지점 (초)
 
 
-class Player(BaseModel):
+# 점수가 자주 바뀌므로 검증 없는 일반 객체로 유지 (스키마 문서화는 그대로 가능)
+@dataclass(slots=True)
+class Player:
     username: str
     score: int
 
@@ -296,94 +497,287 @@ class GameState(BaseModel):
     showing_answer: bool = False  # 정답 페이지를 보여주는 중인지 여부
 
 
+class GameStateInfo(GameState):
+    """/api/game/state 응답 (진행률 표시용 필드 추가)"""
+
+    total_songs: int
+    current_progress: int
+
+
+class GameStateUpdate(BaseModel):
+    """게임 시작/다음 곡 응답"""
+
+    message: str
+    state: GameState
+
+
 class LoadCsvRequest(BaseModel):
     filename: str
 
 
+@dataclass(slots=True)
+class GameStateRuntime:
+    """서버 내부에서 변경하는 게임 상태 (검증 없는 일반 객체, 응답 시 GameState 구조의 dict로 변환)"""
+
+    current_song_index: int = 0
+    # 닉네임 -> 플레이어 (dict 삽입 순서가 곧 참가 순서)
+    players: dict[str, Player] = field(default_factory=dict)
+    is_playing: bool = False
+    show_hint: bool = False
+    current_winners: List[str] = field(default_factory=list)
+    song_order: List[int] = field(default_factory=list)
+    played_count: int = 0
+    showing_answer: bool = False
+
+    def to_dict(self) -> dict:
+        """GameState와 같은 구조의 일반 dict 생성 (Pydantic 변환 없이 바로 직렬화)"""
+        return {
+            "current_song_index": self.current_song_index,
+            "players": [
+                {"username": p.username, "score": p.score}
+                for p in self.players.values()
+            ],
+            "is_playing": self.is_playing,
+            "show_hint": self.show_hint,
+            "current_winners": self.current_winners,
+            "song_order": self.song_order,
+            "played_count": self.played_count,
+            "showing_answer": self.showing_answer,
+        }
+
+
+@dataclass(slots=True)
+class SongTable:
+    """노래 데이터를 필드별 리스트로 보관 (같은 인덱스가 같은 노래, Song은 필요할 때만 생성)"""
+
+    titles: List[List[str]] = field(default_factory=list)
+    # 정규화된 정답 -> 해당 정답을 가진 노래 인덱스 집합 (전체 노래 공용 색인)
+    answer_index: dict[str, set[int]] = field(default_factory=dict)
+    youtube_urls: List[str] = field(default_factory=list)
+    artists: List[str] = field(default_factory=list)
+    genres: List[str] = field(default_factory=list)
+    hints: List[str] = field(default_factory=list)
+    start_times: List[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def append(
+        self,
+        title: List[str],
+        youtube_url: str,
+        artist: str,
+        genre: str,
+        hint: str,
+        start_time: int,
+    ):
+        """노래 한 곡 추가"""
+        idx = len(self.titles)
+        self.titles.append(title)
+        for t in title:
+            self.answer_index.setdefault(_normalize_uncached(t), set()).add(idx)
+        self.youtube_urls.append(youtube_url)
+        self.artists.append(artist)
+        self.genres.append(genre)
+        self.hints.append(hint)
+        self.start_times.append(start_time)
+
+    def is_answer(self, idx: int, answer: str) -> bool:
+        """answer가 idx번째 노래의 정답 중 하나인지 확인 (띄어쓰기/대소문자 무시)"""
+        return idx in self.answer_index.get(normalize_title(answer), ())
+
+    def song_dict(self, idx: int) -> dict:
+        """idx번째 노래를 Song과 같은 구조의 dict로 생성 (모델 생성/검증 없이 직렬화용)"""
+        return {
+            "id": idx,
+            "title": self.titles[idx],
+            "youtube_url": self.youtube_urls[idx],
+            "artist": self.artists[idx],
+            "genre": self.genres[idx],
+            "hint": self.hints[idx],
+            "start_time": self.start_times[idx],
+        }
+
+    def song(self, idx: int) -> Song:
+        """idx번째 노래를 Song 모델로 생성"""
+        data = self.song_dict(idx)
+        # 로더가 이미 형식을 맞춘 값이므로 검증 생략 (DEBUG일 때만 검증)
+        if DEBUG:
+            return Song(**data)
+        return Song.model_construct(**data)
+
+
+@dataclass(frozen=True, slots=True)
+class SongCatalog:
+    """노래 테이블과 응답용 JSON 캐시 묶음 (load_songs가 새로 만들어 통째로 교체)"""
+
+    table: SongTable = field(default_factory=SongTable)
+    # 전체 노래 목록 JSON (/api/songs)
+    songs_json: bytes = b"[]"
+    # 노래 인덱스 -> 개별 노래 JSON (/api/songs/{song_id})
+    by_id: List[bytes] = field(default_factory=list)
+    # 노래 인덱스 -> 정답 제외 정보 JSON (/api/game/current-song)
+    current: List[bytes] = field(default_factory=list)
+
+
 # 게임 상태 저장
-game_state = GameState(
-    current_song_index=0,
-    players=[],
-    is_playing=False,
-    show_hint=False,
-    current_winners=[],
-    song_order=[],
-    played_count=0,
-    showing_answer=False,
-)
+# 동시성 규칙: game_state와 아래 순위/정답자 색인은 이벤트 루프 스레드에서만 변경하며,
+# 한 번의 변경 중간에 await하지 않음 (알림은 전송 큐에 넣기만 함).
+# 따라서 읽는 쪽은 잠금 없이 항상 완성된 상태를 봄. 다른 스레드(load_songs)는
+# 노래 테이블과 JSON 캐시를 SongCatalog 하나로 새로 만든 뒤 song_catalog 대입 한 번으로
+# 교체하므로, 읽는 쪽은 song_catalog를 지역 변수로 한 번만 읽어서 사용함.
+game_state = GameStateRuntime()
+
+# 점수 순으로 정렬된 플레이어 목록 (점수 변경 시 해당 플레이어만 재배치)
+# 정렬 키는 (-점수, 참가 순서)로, 동점이면 먼저 참가한 사람이 앞
+ranked_players: List[Player] = []
+_ranking_keys: List[tuple[int, int]] = []
+_join_order: dict[str, int] = {}
+# 순위 목록 JSON 캐시 (점수가 바뀌면 None으로 비우고 다음 조회 때 다시 생성)
+_results_json: bytes | None = None
+
+# 현재 노래 정답자 집합 (game_state.current_winners의 빠른 포함 여부 확인용)
+current_winners_set: set[str] = set()
+
+
+def add_player_score(username: str, points: int):
+    """플레이어 점수 추가 (없으면 새로 등록) 및 순위 목록 갱신"""
+    global _results_json
+    _results_json = None
+    player = game_state.players.get(username)
+    if player is None:
+        player = Player(username=username, score=0)
+        game_state.players[username] = player
+        _join_order[username] = len(_join_order)
+    else:
+        # 기존 위치에서 제거
+        idx = bisect.bisect_left(_ranking_keys, (-player.score, _join_order[username]))
+        del _ranking_keys[idx]
+        del ranked_players[idx]
+
+    player.score += points
+    key = (-player.score, _join_order[username])
+    idx = bisect.bisect_left(_ranking_keys, key)
+    _ranking_keys.insert(idx, key)
+    ranked_players.insert(idx, player)
+
+
+def reset_current_winners():
+    """현재 노래의 정답자 및 중복 채팅 기록 초기화"""
+    game_state.current_winners = []
+    current_winners_set.clear()
+    recent_chats.clear()
+
 
-songs_data: List[Song] = []
+def reset_players():
+    """전체 플레이어 및 순위 초기화"""
+    global _results_json
+    _results_json = None
+    game_state.players.clear()
+    ranked_players.clear()
+    _ranking_keys.clear()
+    _join_order.clear()
+
+
+# 현재 노래 목록과 응답용 JSON 캐시 (load_songs에서 통째로 교체)
+song_catalog = SongCatalog()
+
+
+# 여러 시청자가 같은 추측을 반복해서 보내므로 최근 결과를 캐시
+@functools.lru_cache(maxsize=4096)
+def normalize_title(title: str) -> str:
+    """정답 비교용 정규화 (대소문자 무시, 탭/전각 공백을 포함한 모든 공백 무시)"""
+    # casefold는 유니코드 기준 대소문자 비교 키 (예: ß -> ss)
+    # 공백 제거는 split/join으로 한 번에 처리 (str.translate는 한글 등 비ASCII 문자열에서 약 10배 느림)
+    return "".join(title.casefold().split())
+
+
+# 노래 로드 시에는 제목마다 한 번씩만 정규화하므로 캐시를 거치지 않음
+# (수만 개 제목이 채팅용 캐시를 밀어내지 않도록)
+_normalize_uncached = normalize_title.__wrapped__
+
+
+# 백슬래시 이스케이프 (\X -> X)
+_UNESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+# 쉼표 목록의 한 항목 (이스케이프 쌍, 쉼표/백슬래시 외 문자, 끝에 남은 백슬래시)
+_ESCAPED_ITEM_RE = re.compile(r"(?:\\.|[^,\\]|\\\Z)+", re.DOTALL)
 
 
 def unescape_string(s: str) -> str:
     """이스케이프 시퀀스를 실제 문자로 변환"""
-    result = []
-    i = 0
-    while i < len(s):
-        if s[i] == "\\" and i + 1 < len(s):
-            # 백슬래시 다음 문자를 그대로 추가
-            result.append(s[i + 1])
-            i += 2
-        else:
-            result.append(s[i])
-            i += 1
-    return "".join(result)
+    # 대부분의 제목에는 백슬래시가 없으므로 정규식 호출 생략
+    if "\\" not in s:
+        return s
+    return _UNESCAPE_RE.sub(r"\1", s)
 
 
 def parse_escaped_list(content: str) -> List[str]:
-    """이스케이프 문자를 고려하여 쉼표로 구분된 리스트 파싱"""
-    items = []
-    current_item = []
-    i = 0
-
-    while i < len(content):
-        if content[i] == "\\" and i + 1 < len(content):
-            # 이스케이프된 문자를 그대로 추가
-            current_item.append(content[i + 1])
-            i += 2
-        elif content[i] == ",":
-            # 이스케이프되지 않은 쉼표: 아이템 구분자
-            item = "".join(current_item).strip()
-            if item:
-                items.append(item)
-            current_item = []
-            i += 1
-        else:
-            current_item.append(content[i])
-            i += 1
-
-    # 마지막 아이템 추가
-    item = "".join(current_item).strip()
-    if item:
-        items.append(item)
-
-    return items
+    """이스케이프 문자를 고려하여 쉼표로 구분된 리스트 파싱 (정규식으로 항목 단위 분리)"""
+    # 이스케이프가 없으면 단순 분리로 충분
+    if "\\" not in content:
+        return [item.strip() for item in content.split(",") if item.strip()]
+    items = (unescape_string(m).strip() for m in _ESCAPED_ITEM_RE.findall(content))
+    return [item for item in items if item]
+
+
+# CSV 읽기 버퍼 크기 (큰 파일에서 read 시스템 콜 횟수 감소)
+CSV_READ_BUFFER = 1 << 16
 
 
 def load_songs(csv_filename: str = "songs.csv"):
     """CSV 파일에서 노래 데이터 로드"""
-    global songs_data
-    songs_data = []
+    # 다른 스레드에서 호출될 수 있으므로 지역 리스트에 채운 뒤 마지막에 한 번에 교체
+    songs = SongTable()
     csv_path = get_data_path(csv_filename)
 
     if not os.path.exists(csv_path):
-        print(f"Warning: {csv_path} not found. Using empty song list.")
+        logger.warning("%s not found. Using empty song list.", csv_path)
+        _publish_songs(songs)
         return 0
 
     try:
-        with open(csv_path, "r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
-            for idx, row in enumerate(reader):
+        # 파일 전체를 메모리에 올리지 않고 큰 버퍼로 한 줄씩 스트리밍
+        # (newline=""은 csv 모듈 권장 설정, 따옴표 안 줄바꿈을 그대로 보존)
+        with open(
+            csv_path, "r", encoding="utf-8", newline="", buffering=CSV_READ_BUFFER
+        ) as file:
+            # 행마다 dict를 만들지 않도록 헤더에서 필요한 열 위치만 구해 튜플로 꺼냄
+            reader = csv.reader(file)
+            header = next(reader, [])
+            # 없는 열은 행 끝에 덧붙인 빈 칸을 가리킴
+            width = len(header) + 1
+            columns = {name: i for i, name in enumerate(header)}
+            pick = operator.itemgetter(
+                *(
+                    columns.get(name, len(header))
+                    for name in (
+                        "title",
+                        "youtube_url",
+                        "artist",
+                        "genre",
+                        "hint",
+                        "start_time",
+                    )
+                )
+            )
+            for row in reader:
+                # 빈 줄은 건너뜀 (DictReader와 동일)
+                if not row:
+                    continue
+                # 헤더보다 긴 행은 잘라내고 짧은 행은 빈 칸으로 채움
+                del row[len(header) :]
+                row += [""] * (width - len(row))
+                title_str, youtube_url, artist, genre, hint, start_time_str = pick(row)
+
                 # start_time을 정수로 변환, 없거나 잘못된 값이면 0
                 try:
-                    start_time = int(row.get("start_time", "0"))
-                except (ValueError, TypeError):
+                    start_time = int(start_time_str or "0")
+                except ValueError:
                     start_time = 0
 
                 # title을 배열로 파싱
                 # 형식: "[다이너마이트, Dynamite]" 또는 "다이너마이트"
                 # 이스케이프 문자 처리: \, \[ \] \" 등을 문자로 인식
-                title_str = row.get("title", "")
                 if title_str.startswith("[") and title_str.endswith("]"):
                     # 대괄호 제거하고 쉼표로 분리 (이스케이프된 쉼표는 분리하지 않음)
                     title_list = parse_escaped_list(title_str[1:-1])
@@ -395,21 +789,46 @@ def load_songs(csv_filename: str = "songs.csv"):
                         else []
                     )
 
-                song = Song(
-                    id=idx,
+                songs.append(
                     title=title_list,
-                    youtube_url=row.get("youtube_url", ""),
-                    artist=row.get("artist", ""),
-                    genre=row.get("genre", ""),
-                    hint=row.get("hint", ""),
+                    youtube_url=youtube_url,
+                    artist=artist,
+                    genre=genre,
+                    hint=hint,
                     start_time=start_time,
                 )
-                songs_data.append(song)
-        print(f"Loaded {len(songs_data)} songs from CSV")
-        return len(songs_data)
+        logger.info("Loaded %d songs from CSV", len(songs))
+        return len(songs)
     except Exception as e:
-        print(f"Error loading songs: {e}")
+        logger.error("Error loading songs: %s", e)
         return 0
+    finally:
+        _publish_songs(songs)
+
+
+def _publish_songs(songs: SongTable):
+    """로드한 노래 목록과 응답용 JSON 캐시를 전역 상태로 교체"""
+    global song_catalog
+    by_id = [json_dumps(songs.song_dict(idx)) for idx in range(len(songs))]
+    songs_json = b"[" + b",".join(by_id) + b"]"
+    current = [
+        json_dumps(
+            {
+                "id": idx,
+                "youtube_url": songs.youtube_urls[idx],
+                "genre": songs.genres[idx],
+                # 힌트를 항상 포함 (프론트엔드에서 표시 시점 결정)
+                "hint": songs.hints[idx],
+                "artist": songs.artists[idx],
+                "start_time": songs.start_times[idx],
+            }
+        )
+        for idx in range(len(songs))
+    ]
+    # 대입 한 번으로 교체하므로 읽는 쪽은 서로 맞지 않는 테이블/캐시 조합을 보지 않음
+    song_catalog = SongCatalog(
+        table=songs, songs_json=songs_json, by_id=by_id, current=current
+    )
 
 
 @app.get("/api/health")
@@ -418,49 +837,47 @@ async def health_check():
     return {"status": "ok", "message": "노래 맞추기 게임 API"}
 
 
-@app.get("/api/songs", response_model=List[Song])
+@app.get("/api/songs", responses={200: {"model": List[Song]}})
 async def get_songs():
-    """모든 노래 목록 반환"""
-    return songs_data
+    """모든 노래 목록 반환 (미리 직렬화된 JSON)"""
+    return Response(content=song_catalog.songs_json, media_type="application/json")
 
 
-@app.get("/api/songs/{song_id}", response_model=Song)
+@app.get("/api/songs/{song_id}", responses={200: {"model": Song}})
 async def get_song(song_id: int):
     """특정 노래 정보 반환"""
-    if song_id < 0 or song_id >= len(songs_data):
+    by_id = song_catalog.by_id
+    if song_id < 0 or song_id >= len(by_id):
         raise HTTPException(status_code=404, detail="Song not found")
-    return songs_data[song_id]
+    return Response(content=by_id[song_id], media_type="application/json")
 
 
 @app.get("/api/game/current-song")
 async def get_current_song():
-    """현재 플레이 중인 노래 정보 반환 (정답 제외)"""
-    if game_state.current_song_index >= len(songs_data):
+    """현재 플레이 중인 노래 정보 반환 (정답 제외, 미리 직렬화된 JSON)"""
+    # 노래 목록이 교체되어도 같은 캐시 기준으로 범위를 확인
+    cache = song_catalog.current
+    if game_state.current_song_index >= len(cache):
         raise HTTPException(status_code=404, detail="No more songs")
 
-    song = songs_data[game_state.current_song_index]
-    return {
-        "id": song.id,
-        "youtube_url": song.youtube_url,
-        "genre": song.genre,
-        "hint": song.hint,  # 힌트를 항상 포함 (프론트엔드에서 표시 시점 결정)
-        "artist": song.artist,
-        "start_time": song.start_time,
-    }
+    return Response(
+        content=cache[game_state.current_song_index], media_type="application/json"
+    )
 
 
 @app.get("/api/game/current-song/answer")
 async def get_current_song_answer():
     """현재 노래의 정답 정보 반환"""
-    if game_state.current_song_index >= len(songs_data):
+    songs = song_catalog.table
+    if game_state.current_song_index >= len(songs):
         raise HTTPException(status_code=404, detail="No more songs")
 
     # 정답 페이지로 진입했음을 표시 (정답 입력 방지)
     game_state.showing_answer = True
 
-    song_data = songs_data[game_state.current_song_index]
+    song_data = songs.song(game_state.current_song_index)
     return {
-        **song_data.dict(),
+        **song_data.model_dump(),
         "winner": ", ".join(game_state.current_winners)
         if game_state.current_winners
         else "",
@@ -478,32 +895,36 @@ async def get_current_winner():
     }
 
 
-@app.post("/api/game/start")
+@app.post("/api/game/start", responses={200: {"model": GameStateUpdate}})
 async def start_game():
     """게임 시작"""
     # 랜덤 순서 생성 (중복 없이)
-    song_indices = list(range(len(songs_data)))
-    random.shuffle(song_indices)
+    # song_order는 게임 상태 응답에 그대로 포함되고 total_songs 계산에도 쓰이므로
+    # 지연 생성기 대신 전체 순서를 미리 만들어 둠
+    song_count = len(song_catalog.table)
+    song_indices = random.sample(range(song_count), song_count)
 
     game_state.song_order = song_indices
     game_state.played_count = 0
     game_state.current_song_index = song_indices[0] if song_indices else 0
-    game_state.players = []
+    reset_players()
     game_state.is_playing = True
     game_state.show_hint = False
-    game_state.current_winners = []  # 정답자 초기화
+    reset_current_winners()
     game_state.showing_answer = False  # 정답 페이지 플래그 초기화
 
-    print(f"Game started with random order: {song_indices[:5]}...")  # 처음 5개만 로그
-    return {"message": "Game started", "state": game_state}
+    # 처음 5개만 로그
+    logger.info("Game started with random order: %s...", song_indices[:5])
+    broadcast_scoreboard()
+    return DefaultResponse({"message": "Game started", "state": game_state.to_dict()})
 
 
-@app.post("/api/game/next")
+@app.post("/api/game/next", responses={200: {"model": GameStateUpdate}})
 async def next_song():
     """다음 곡으로 이동 (랜덤 순서)"""
     game_state.played_count += 1
     game_state.show_hint = False
-    game_state.current_winners = []  # 정답자 초기화
+    reset_current_winners()
     game_state.showing_answer = (
         False  # 정답 페이지 플래그 초기화 (새 곡으로 이동하면 정답 입력 가능)
     )
@@ -511,15 +932,22 @@ async def next_song():
     # 모든 곡을 재생했는지 확인
     if game_state.played_count >= len(game_state.song_order):
         game_state.is_playing = False
-        return {"message": "Game finished", "state": game_state}
+        broadcast_scoreboard()
+        return DefaultResponse(
+            {"message": "Game finished", "state": game_state.to_dict()}
+        )
 
     # 다음 곡 인덱스 가져오기
     game_state.current_song_index = game_state.song_order[game_state.played_count]
-    print(
-        f"Next song: index {game_state.current_song_index} ({game_state.played_count + 1}/{len(game_state.song_order)})"
+    logger.info(
+        "Next song: index %d (%d/%d)",
+        game_state.current_song_index,
+        game_state.played_count + 1,
+        len(game_state.song_order),
     )
 
-    return {"message": "Next song", "state": game_state}
+    broadcast_scoreboard()
+    return DefaultResponse({"message": "Next song", "state": game_state.to_dict()})
 
 
 @app.post("/api/game/show-hint")
@@ -535,44 +963,31 @@ async def check_answer(username: str, answer: str):
     정답 확인 (치지직 채팅 연동용)
     추후 치지직 API와 연동하여 구현 예정
     """
-    if game_state.current_song_index >= len(songs_data):
+    songs = song_catalog.table
+    if game_state.current_song_index >= len(songs):
         raise HTTPException(status_code=404, detail="No current song")
 
+    def _resp(is_correct: bool, message: str | None = None):
+        """응답 본문을 한 곳에서 만들어 바로 직렬화"""
+        content = {"is_correct": is_correct, "username": username, "answer": answer}
+        if message:
+            content["message"] = message
+        return DefaultResponse(content)
+
     # 정답 페이지를 보여주는 중이면 정답 입력 불가
     if game_state.showing_answer:
-        return {
-            "is_correct": False,
-            "username": username,
-            "answer": answer,
-            "message": "정답 페이지 중입니다",
-        }
+        return _resp(False, "정답 페이지 중입니다")
 
     # 이미 3명의 정답자가 나왔으면 무시
     if len(game_state.current_winners) >= 3:
-        return {
-            "is_correct": False,
-            "username": username,
-            "answer": answer,
-            "message": "이미 3명의 정답자가 나왔습니다",
-        }
+        return _resp(False, "이미 3명의 정답자가 나왔습니다")
 
     # 이미 정답을 맞춘 사람은 무시
-    if username in game_state.current_winners:
-        return {
-            "is_correct": False,
-            "username": username,
-            "answer": answer,
-            "message": "이미 정답을 맞췄습니다",
-        }
-
-    current_song = songs_data[game_state.current_song_index]
+    if username in current_winners_set:
+        return _resp(False, "이미 정답을 맞췄습니다")
 
     # 여러 정답 중 하나라도 일치하면 정답으로 인정 (띄어쓰기 무시)
-    answer_normalized = answer.strip().lower().replace(" ", "")
-    is_correct = any(
-        answer_normalized == title.strip().lower().replace(" ", "")
-        for title in current_song.title
-    )
+    is_correct = songs.is_answer(game_state.current_song_index, answer)
 
     if is_correct:
         # 순위에 따른 점수 계산
@@ -586,34 +1001,32 @@ async def check_answer(username: str, answer: str):
             points = 1
 
         # 플레이어 점수 업데이트
-        player_found = False
-        for player in game_state.players:
-            if player.username == username:
-                player.score += points
-                player_found = True
-                break
-
-        if not player_found:
-            game_state.players.append(Player(username=username, score=points))
+        add_player_score(username, points)
 
         # 현재 노래의 정답자 저장
         game_state.current_winners.append(username)
+        current_winners_set.add(username)
+        broadcast_scoreboard()
 
-    return {"is_correct": is_correct, "username": username, "answer": answer}
+    return _resp(is_correct)
 
 
-@app.get("/api/game/results", response_model=List[Player])
+@app.get("/api/game/results", responses={200: {"model": List[Player]}})
 async def get_results():
-    """게임 결과 반환 (점수 순으로 정렬)"""
-    sorted_players = sorted(game_state.players, key=lambda p: p.score, reverse=True)
-    return sorted_players
+    """게임 결과 반환 (점수 순으로 정렬, 점수가 바뀔 때까지 직렬화 결과 재사용)"""
+    global _results_json
+    if _results_json is None:
+        _results_json = json_dumps(
+            [{"username": p.username, "score": p.score} for p in ranked_players]
+        )
+    return Response(content=_results_json, media_type="application/json")
 
 
-@app.get("/api/game/state")
+@app.get("/api/game/state", responses={200: {"model": GameStateInfo}})
 async def get_game_state():
     """현재 게임 상태 반환"""
     total_songs = (
-        len(game_state.song_order) if game_state.song_order else len(songs_data)
+        len(game_state.song_order) if game_state.song_order else len(song_catalog.table)
     )
     current_progress = (
         game_state.played_count + 1
@@ -621,11 +1034,10 @@ async def get_game_state():
         else game_state.played_count
     )
 
-    return {
-        **game_state.dict(),
-        "total_songs": total_songs,
-        "current_progress": current_progress,
-    }
+    state = game_state.to_dict()
+    state["total_songs"] = total_songs
+    state["current_progress"] = current_progress
+    return DefaultResponse(state)
 
 
 # 새 API: CSV 파일 로드
@@ -639,7 +1051,8 @@ async def load_csv_file(request: LoadCsvRequest):
             status_code=404, detail=f"CSV file not found: {request.filename}"
         )
 
-    count = load_songs(request.filename)
+    # 파일 읽기/파싱 동안 이벤트 루프를 막지 않도록 스레드에서 실행
+    count = await asyncio.to_thread(load_songs, request.filename)
     return {
         "message": f"Loaded {count} songs",
         "song_count": count,
@@ -651,8 +1064,9 @@ async def load_csv_file(request: LoadCsvRequest):
 @app.post("/api/game/reset-scores")
 async def reset_scores():
     """모든 참가자 점수 초기화"""
-    game_state.players = []
-    game_state.current_winners = []
+    reset_players()
+    reset_current_winners()
+    broadcast_scoreboard()
     return {"message": "Scores reset", "players": []}
 
 
@@ -660,62 +1074,155 @@ async def reset_scores():
 @app.get("/api/game/participants")
 async def get_all_participants():
     """전체 참가자 목록 반환 (점수 순 정렬)"""
-    sorted_players = sorted(game_state.players, key=lambda p: p.score, reverse=True)
-    return {
-        "total_count": len(sorted_players),
-        "players": [player.dict() for player in sorted_players],
-    }
+    return DefaultResponse(
+        {
+            "total_count": len(ranked_players),
+            "players": [
+                {"username": p.username, "score": p.score} for p in ranked_players
+            ],
+        }
+    )
+
+
+# 정답자/리더보드 변경을 폴링 없이 전달하는 WebSocket 구독자
+# 구독자마다 전송 큐와 전송 태스크를 두어 느린 클라이언트가 다른 처리를 막지 않게 함
+BROADCAST_QUEUE_SIZE = 16
+
+
+# 집합에 넣기 위해 객체 동일성으로 비교/해시
+@dataclass(slots=True, eq=False)
+class GameClient:
+    """/ws/game 구독자 하나의 전송 큐와 전송 태스크"""
+
+    websocket: WebSocket
+    outbox: asyncio.Queue = field(
+        default_factory=lambda: asyncio.Queue(maxsize=BROADCAST_QUEUE_SIZE)
+    )
+    sender: asyncio.Task | None = None
+
+
+game_clients: set[GameClient] = set()
+
+
+def _scoreboard_json() -> str:
+    """/api/game/winner와 /api/game/results를 합친 구조의 JSON"""
+    return json_dumps(
+        {
+            "winner": ", ".join(game_state.current_winners),
+            "winner_count": len(game_state.current_winners),
+            "players": [
+                {"username": p.username, "score": p.score} for p in ranked_players
+            ],
+        }
+    ).decode("utf-8")
+
+
+def broadcast_scoreboard():
+    """연결된 모든 구독자의 전송 큐에 현재 정답자/순위를 넣음 (기다리지 않음)
+
+    큐가 가득 찬 (따라가지 못하는) 구독자는 전송 태스크를 취소해 연결을 닫고,
+    클라이언트가 재연결하면서 최신 상태를 다시 받도록 함
+    """
+    if not game_clients:
+        return
+    data = _scoreboard_json()
+    for client in list(game_clients):
+        try:
+            client.outbox.put_nowait(data)
+        except asyncio.QueueFull:
+            game_clients.discard(client)
+            if client.sender is not None:
+                client.sender.cancel()
+
+
+async def _send_scoreboard_loop(client: GameClient):
+    """전송 큐에 쌓인 메시지를 순서대로 전송"""
+    while True:
+        data = await client.outbox.get()
+        await client.websocket.send_text(data)
+
+
+async def _receive_until_disconnect(websocket: WebSocket):
+    """클라이언트 메시지는 사용하지 않고 연결 종료만 감지"""
+    while True:
+        await websocket.receive_text()
+
+
+@app.websocket("/ws/game")
+async def game_events(websocket: WebSocket):
+    """게임 이벤트 구독 (연결 직후 현재 상태, 이후 변경 시마다 전송)"""
+    await websocket.accept()
+    client = GameClient(websocket)
+    client.outbox.put_nowait(_scoreboard_json())
+    client.sender = asyncio.create_task(_send_scoreboard_loop(client))
+    receiver = asyncio.create_task(_receive_until_disconnect(websocket))
+    game_clients.add(client)
+    try:
+        # 전송 실패/취소 또는 연결 종료 중 먼저 일어난 쪽에서 정리
+        await asyncio.wait(
+            (client.sender, receiver), return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        game_clients.discard(client)
+        client.sender.cancel()
+        receiver.cancel()
+        await asyncio.gather(client.sender, receiver, return_exceptions=True)
+        # 연결이 살아 있으면 닫아서 클라이언트가 재연결하도록 함
+        try:
+            await websocket.close()
+        except Exception:
+            pass
 
 
-async def connect_to_chzzk_socket(access_token: str):
-    """백그라운드에서 치지직 소켓 URL을 요청하고 연결을 설정"""
+async def connect_to_chzzk_socket(access_token: str) -> bool:
+    """백그라운드에서 치지직 소켓 URL을 요청하고 연결을 설정 (소켓 연결 성공 여부 반환)"""
     global current_access_token
     current_access_token = access_token
 
     print("Starting background task for Chzzk socket connection...")
     try:
-        async with aiohttp.ClientSession() as session:
-            # 치지직 Open API 세션 생성 엔드포인트
-            session_url = "https://openapi.chzzk.naver.com/open/v1/sessions/auth"
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json",
-            }
-            async with session.get(session_url, headers=headers) as session_response:
-                if session_response.status == 200:
-                    session_data = await session_response.json()
-                    # session_data 구조: {"code": 200, "message": "Success", "content": {"url": "wss://..."}}
-                    socket_url = session_data.get("content", {}).get("url")
-                    print(f"Background: Socket URL obtained: {socket_url}")
-
-                    if socket_url:
-                        try:
-                            # 이미 연결되어 있다면 해제
-                            if sio.connected:
-                                await sio.disconnect()
-
-                            # 소켓 연결
-                            await sio.connect(socket_url, transports=["websocket"])
-                            print("Socket.IO connection initiated")
-                        except Exception as e:
-                            print(f"Failed to connect to Socket.IO: {e}")
-                else:
-                    error_text = await session_response.text()
-                    print(
-                        f"Background: Failed to get session URL: {session_response.status} - {error_text}"
-                    )
+        # 치지직 Open API 세션 생성 엔드포인트
+        session_url = "https://openapi.chzzk.naver.com/open/v1/sessions/auth"
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+        }
+        socket_url = None
+        async with app.state.http.get(session_url, headers=headers) as session_response:
+            if session_response.status == 200:
+                session_data = await session_response.json()
+                # session_data 구조: {"code": 200, "message": "Success", "content": {"url": "wss://..."}}
+                socket_url = session_data.get("content", {}).get("url")
+                print(f"Background: Socket URL obtained: {socket_url}")
+            else:
+                error_text = await session_response.text()
+                print(
+                    f"Background: Failed to get session URL: {session_response.status} - {error_text}"
+                )
+
+        # 소켓 연결은 HTTP 응답을 닫아 연결을 풀에 반환한 뒤에 진행
+        if socket_url:
+            try:
+                # 이미 연결되어 있다면 해제
+                if sio.connected:
+                    await sio.disconnect()
+
+                # 소켓 연결
+                await sio.connect(socket_url, transports=["websocket"])
+                print("Socket.IO connection initiated")
+                return True
+            except Exception as e:
+                print(f"Failed to connect to Socket.IO: {e}")
     except Exception as e:
         print(f"Background: Error in socket connection task: {e}")
+    return False
 
 
 @app.get("/redirect")
 async def chzzk_callback(code: str, state: str, background_tasks: BackgroundTasks):
     """치지직 인증 콜백 및 토큰 발급"""
     global current_access_token
-    client_id = os.getenv("CHZZK_CLIENT_ID")
-    client_secret = os.getenv("CHZZK_CLIENT_SECRET")
-
-    if not client_id or not client_secret:
+    if not CHZZK_CFG.client_id or not CHZZK_CFG.client_secret:
         raise HTTPException(
             status_code=500,
             detail="Server configuration error: Missing Client ID or Secret",
@@ -723,41 +1230,38 @@ async def chzzk_callback(code: str, state: str, background_tasks: BackgroundTask
 
     token_url = "https://openapi.chzzk.naver.com/auth/v1/token"
 
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.post(
-                token_url,
-                json={
-                    "grantType": "authorization_code",
-                    "clientId": client_id,
-                    "clientSecret": client_secret,
-                    "code": code,
-                    "state": state,
-                },
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise HTTPException(
-                        status_code=response.status,
-                        detail=f"Failed to get access token: {error_text}",
-                    )
+    try:
+        async with app.state.http.post(
+            token_url,
+            json={
+                "grantType": "authorization_code",
+                "clientId": CHZZK_CFG.client_id,
+                "clientSecret": CHZZK_CFG.client_secret,
+                "code": code,
+                "state": state,
+            },
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise HTTPException(
+                    status_code=response.status,
+                    detail=f"Failed to get access token: {error_text}",
+                )
 
-                data = await response.json()
-                # data 구조: {"code": 200, "message": "Success", "content": {"accessToken": "...", "refreshToken": "...", ...}}
+            data = await response.json()
+            # data 구조: {"code": 200, "message": "Success", "content": {"accessToken": "...", "refreshToken": "...", ...}}
 
-                print(f"Chzzk Auth Success: {data}")
+            print(f"Chzzk Auth Success: {data}")
 
-                # 엑세스 토큰으로 세션 URL 요청 (백그라운드 작업으로 실행)
-                access_token = data.get("content", {}).get("accessToken")
-                if access_token:
-                    current_access_token = access_token
-                    background_tasks.add_task(connect_to_chzzk_socket, access_token)
+            # 엑세스 토큰으로 세션 URL 요청 (백그라운드 작업으로 실행)
+            access_token = data.get("content", {}).get("accessToken")
+            if access_token:
+                current_access_token = access_token
+                background_tasks.add_task(connect_to_chzzk_socket, access_token)
 
-                return RedirectResponse(url="/")
-        except Exception as e:
-            raise HTTPException(
-                status_code=500, detail=f"Token exchange failed: {str(e)}"
-            )
+            return RedirectResponse(url="/")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Token exchange failed: {str(e)}")
 
 
 @app.get("/api/chzzk/status")
@@ -766,6 +1270,22 @@ async def get_chzzk_status():
     return {"connected": sio.connected, "has_token": current_access_token is not None}
 
 
+class CachedStaticFiles(StaticFiles):
+    """프론트엔드 빌드 결과물 서빙 (파일명에 해시가 붙은 assets/는 브라우저가 계속 캐시)"""
+
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            if path.startswith("assets" + os.sep):
+                response.headers["Cache-Control"] = (
+                    "public, max-age=31536000, immutable"
+                )
+            else:
+                # index.html 등은 새 빌드가 바로 반영되도록 매번 재검증 (ETag로 304 응답)
+                response.headers["Cache-Control"] = "no-cache"
+        return response
+
+
 # 프론트엔드 정적 파일 서빙 (빌드 후)
 frontend_dist_path = resource_path("frontend/dist")
 print(f"[NoMat] Frontend path: {frontend_dist_path}")
@@ -773,10 +1293,20 @@ print(f"[NoMat] Frontend exists: {os.path.exists(frontend_dist_path)}")
 if os.path.exists(frontend_dist_path):
     print("[NoMat] Mounting frontend at /")
     app.mount(
-        "/", StaticFiles(directory=frontend_dist_path, html=True), name="frontend"
+        "/", CachedStaticFiles(directory=frontend_dist_path, html=True), name="frontend"
     )
 else:
     print("[NoMat] WARNING: Frontend not found! Game UI will not be available.")
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # C 구현 이벤트 루프(uvloop, Windows 제외)와 HTTP 파서(httptools) 사용
+    # game_state/song_catalog가 프로세스 메모리에 있으므로 워커는 1개로 유지
+    # (여러 워커로 늘리려면 상태를 공유 저장소로 옮겨야 함)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=1,
+    )
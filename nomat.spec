@@ -26,9 +26,11 @@ a = Analysis(
         'uvicorn.logging',
         'uvicorn.loops',
         'uvicorn.loops.auto',
+        'uvicorn.loops.uvloop',
         'uvicorn.protocols',
         'uvicorn.protocols.http',
         'uvicorn.protocols.http.auto',
+        'uvicorn.protocols.http.httptools_impl',
         'uvicorn.protocols.websockets',
         'uvicorn.protocols.websockets.auto',
         'uvicorn.lifespan',
@@ -41,10 +43,12 @@ a = Analysis(
         'chzzkpy.unofficial.chat',
         'dotenv',
         'requests',
+        'orjson',
         'anyio',
         'anyio._backends',
         'anyio._backends._asyncio',
         'httptools',
+        'uvloop',
         'websockets',
         'watchfiles',
     ],